@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib.resources
 from pathlib import Path
+from typing import Any
 
 from pyclaw.agent.context import ContextBuilder
 from pyclaw.config.models import AgentConfig, AgentDefaults, Config
@@ -39,9 +40,16 @@ class AgentInstance:
             self.fallbacks = defaults.model_fallbacks
 
         self.max_iterations = defaults.max_tool_iterations
+        self.history_window = defaults.history_window
         self.max_tokens = defaults.max_tokens
         self.temperature = defaults.temperature or 0.7
         self.restrict_to_workspace = defaults.restrict_to_workspace
+        # Constant for the lifetime of the instance — built once so the
+        # agent loop does not allocate a fresh dict per LLM iteration.
+        self.llm_options: dict[str, Any] = {
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }
 
         self.provider = provider
         self.skills_filter = agent_cfg.skills
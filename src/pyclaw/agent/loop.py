@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
+import orjson
+
 from pyclaw.agent.instance import AgentInstance
 from pyclaw.agent.registry import AgentRegistry
 from pyclaw.bus.message_bus import MessageBus
@@ -28,6 +31,15 @@ logger = logging.getLogger(__name__)
 # Type for streaming chunk callbacks
 StreamCallback = Callable[[str], Any]
 
+# Short-lived cache for idempotent tool results (see Tool.cacheable)
+_TOOL_CACHE_MAX = 256
+_TOOL_CACHE_TTL = 60.0  # seconds
+
+_SUMMARY_PREFIX = (
+    "Summarize the following conversation concisely, "
+    "capturing key facts, decisions, and context:\n\n"
+)
+
 
 @dataclass
 class ProcessOptions:
@@ -57,6 +69,7 @@ class AgentLoop:
         self._running = False
         self._summarize_threshold = 20  # messages before summarization
         self._on_stream: StreamCallback | None = None
+        self._tool_cache: OrderedDict[tuple[str, bytes], tuple[float, Any]] = OrderedDict()
         self._fallback_chain = FallbackChain(
             {"primary": provider, "fallback": provider}
         )
@@ -118,11 +131,13 @@ class AgentLoop:
         response = await self._run_agent_loop(agent, opts)
 
         if opts.send_response and response:
-            await self._bus.publish_outbound(OutboundMessage(
-                channel=msg.channel,
-                chat_id=msg.chat_id,
-                content=response,
-            ))
+            await self._bus.publish_outbound_many([
+                OutboundMessage(
+                    channel=msg.channel,
+                    chat_id=msg.chat_id,
+                    content=response,
+                )
+            ])
 
     async def _run_agent_loop(
         self,
@@ -130,8 +145,12 @@ class AgentLoop:
         opts: ProcessOptions,
     ) -> str:
         """Run the LLM iteration loop for one message."""
-        # Load or create session
+        # Load or create session. Only the last history_window messages are
+        # prefilled; older context lives in the rolling summary, so prompt
+        # size stays bounded as the session grows.
         history = [] if opts.no_history else agent.sessions.get_history(opts.session_key)
+        if agent.history_window > 0:
+            history = history[-agent.history_window:]
         summary = agent.sessions.get_summary(opts.session_key)
 
         # Save user message to session
@@ -181,22 +200,30 @@ class AgentLoop:
             if not opts.no_history:
                 agent.sessions.add_full_message(opts.session_key, assistant_msg)
 
-            for tc in response.tool_calls:
-                tool_name = tc.function.name if tc.function else tc.name
-                tool_args = (
-                    json.loads(tc.function.arguments)
-                    if tc.function and tc.function.arguments
-                    else tc.arguments
-                )
-
+            # Parse all arguments up front so gather-time is purely I/O,
+            # then dispatch the calls concurrently — tool calls within one
+            # LLM turn have no data dependency on each other.
+            calls = [self._parse_tool_call(tc) for tc in response.tool_calls]
+            for tool_name, tool_args in calls:
                 logger.info("Tool call: %s(%s)", tool_name, list(tool_args.keys()))
-                result = await agent.tools.execute(
-                    tool_name, tool_args, opts.channel, opts.chat_id
-                )
+            results = await asyncio.gather(
+                *(
+                    self._execute_tool(agent, name, args, opts.channel, opts.chat_id)
+                    for name, args in calls
+                ),
+                return_exceptions=True,
+            )
 
+            # Append tool results in the original call order so the
+            # conversation transcript stays deterministic.
+            for tc, result in zip(response.tool_calls, results):
+                if isinstance(result, BaseException):
+                    content = f"Tool execution error: {result}"
+                else:
+                    content = result.for_llm
                 tool_msg = Message(
                     role="tool",
-                    content=result.for_llm,
+                    content=content,
                     tool_call_id=tc.id,
                 )
                 messages.append(tool_msg)
@@ -209,21 +236,70 @@ class AgentLoop:
         # Save assistant response
         if response_text and not opts.no_history:
             agent.sessions.add_message(opts.session_key, "assistant", response_text)
-            agent.sessions.save(opts.session_key)
 
-        # Maybe summarize
+        # Maybe summarize — read the (possibly grown) history once and hand
+        # it through so the summarizer does not reload the session.
         if opts.enable_summary:
-            await self._maybe_summarize(agent, opts.session_key)
+            await self._maybe_summarize(
+                agent, opts.session_key, agent.sessions.get_history(opts.session_key)
+            )
+
+        # One coalesced write per turn, skipped when nothing changed.
+        agent.sessions.save_if_dirty(opts.session_key)
 
         return response_text
 
+    async def _execute_tool(
+        self,
+        agent: AgentInstance,
+        name: str,
+        args: dict[str, Any],
+        channel: str,
+        chat_id: str,
+    ):
+        """Execute a tool, serving repeat calls to cacheable tools from cache.
+
+        Idempotent tools (web search/fetch) are often re-invoked with
+        identical arguments across iterations; a small TTL-bounded LRU
+        short-circuits those round-trips. Errors are never cached.
+        """
+        tool = agent.tools.get(name)
+        if tool is None or not tool.cacheable():
+            return await agent.tools.execute(name, args, channel, chat_id)
+
+        key = (name, orjson.dumps(args, option=orjson.OPT_SORT_KEYS))
+        now = time.monotonic()
+        cached = self._tool_cache.get(key)
+        if cached is not None:
+            ts, result = cached
+            if now - ts < _TOOL_CACHE_TTL:
+                self._tool_cache.move_to_end(key)
+                logger.debug("Tool cache hit: %s", name)
+                return result
+            del self._tool_cache[key]
+
+        result = await agent.tools.execute(name, args, channel, chat_id)
+        if not result.is_error:
+            self._tool_cache[key] = (now, result)
+            if len(self._tool_cache) > _TOOL_CACHE_MAX:
+                self._tool_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _parse_tool_call(tc: ToolCall) -> tuple[str, dict[str, Any]]:
+        """Extract (name, args) from a tool call, decoding JSON arguments."""
+        if tc.function:
+            name = tc.function.name
+            args = orjson.loads(tc.function.arguments) if tc.function.arguments else tc.arguments
+        else:
+            name = tc.name
+            args = tc.arguments
+        return name, args
+
     async def _call_llm(self, agent: AgentInstance, messages: list[Message]) -> LLMResponse:
         """Call the LLM provider with fallback chain and optional streaming."""
         tool_defs = agent.tools.get_definitions()
-        options: dict[str, Any] = {
-            "max_tokens": agent.max_tokens,
-            "temperature": agent.temperature,
-        }
+        options = agent.llm_options
 
         # Use fallback chain if agent has fallback candidates
         if len(agent.candidates) > 1:
@@ -241,9 +317,13 @@ class AgentLoop:
 
         return await agent.provider.chat(messages, tool_defs, agent.model, options)
 
-    async def _maybe_summarize(self, agent: AgentInstance, session_key: str) -> None:
+    async def _maybe_summarize(
+        self,
+        agent: AgentInstance,
+        session_key: str,
+        history: list[Message],
+    ) -> None:
         """Summarize conversation if it exceeds threshold."""
-        history = agent.sessions.get_history(session_key)
         if len(history) < self._summarize_threshold:
             return
 
@@ -252,12 +332,9 @@ class AgentLoop:
         if not to_summarize:
             return
 
-        summary_prompt = (
-            "Summarize the following conversation concisely, "
-            "capturing key facts, decisions, and context:\n\n"
+        summary_prompt = _SUMMARY_PREFIX + "".join(
+            f"[{msg.role}]: {msg.preview}\n" for msg in to_summarize
         )
-        for msg in to_summarize:
-            summary_prompt += f"[{msg.role}]: {msg.content[:500]}\n"
 
         try:
             summary_response = await agent.provider.chat(
@@ -272,7 +349,6 @@ class AgentLoop:
                 new_summary = f"{existing_summary}\n\n{new_summary}"
             agent.sessions.set_summary(session_key, new_summary)
             agent.sessions.set_history(session_key, history[-4:])
-            agent.sessions.save(session_key)
             logger.info("Session %s summarized", session_key)
         except Exception:
             logger.exception("Failed to summarize session %s", session_key)
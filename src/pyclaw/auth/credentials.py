@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import time
-from dataclasses import dataclass, asdict
-from pathlib import Path
+from dataclasses import dataclass
 from typing import Any
+from pathlib import Path
+
+import orjson
 
 from pyclaw.auth.openai_oauth import OAuthCredentials, refresh_token
 
 logger = logging.getLogger(__name__)
 
+# Refresh OAuth tokens this many seconds before their actual expiry.
+_EXPIRY_BUFFER_SECONDS = 300
+
 
 @dataclass
 class StoredCredential:
@@ -25,16 +29,37 @@ class StoredCredential:
     expires_at: float = 0.0
     account_id: str = ""
 
-    def is_expired(self, buffer_seconds: int = 300) -> bool:
-        if self.auth_type != "oauth":
-            return False
-        return time.time() >= (self.expires_at - buffer_seconds)
+    def __post_init__(self) -> None:
+        # Precomputed for the hot get_valid_token path: a single compare
+        # for expiry (API keys never expire) and a pre-dispatched token.
+        # The deadline is anchored to the monotonic clock so NTP steps or
+        # suspend/resume cannot make an expired token look fresh; the
+        # wall-clock expires_at field is kept for persistence.
+        self._expiry_cutoff = (
+            time.monotonic() + (self.expires_at - time.time()) - _EXPIRY_BUFFER_SECONDS
+            if self.auth_type == "oauth"
+            else float("inf")
+        )
+        self._token = self.api_key if self.auth_type == "api_key" else self.access_token
+
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self._expiry_cutoff
 
     def get_api_key(self) -> str:
         """Return the usable API key/token."""
-        if self.auth_type == "api_key":
-            return self.api_key
-        return self.access_token
+        return self._token
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flat dict for persistence — avoids asdict's reflective walk."""
+        return {
+            "auth_type": self.auth_type,
+            "provider": self.provider,
+            "api_key": self.api_key,
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_at": self.expires_at,
+            "account_id": self.account_id,
+        }
 
 
 class CredentialStore:
@@ -50,19 +75,21 @@ class CredentialStore:
         if not os.path.isfile(self._cred_file):
             return
         try:
-            with open(self._cred_file) as f:
-                data = json.load(f)
-            for key, val in data.items():
-                self._credentials[key] = StoredCredential(**val)
-        except (json.JSONDecodeError, TypeError, KeyError):
+            with open(self._cred_file, "rb") as f:
+                data = orjson.loads(f.read())
+            # Single allocation sized to the final dict — no per-insert rehash
+            self._credentials = {
+                key: StoredCredential(**val) for key, val in data.items()
+            }
+        except (ValueError, TypeError, KeyError):
             logger.warning("Failed to load credentials, starting fresh")
 
     def _save(self) -> None:
         os.makedirs(self._config_dir, exist_ok=True)
-        data = {k: asdict(v) for k, v in self._credentials.items()}
+        data = {k: v.to_dict() for k, v in self._credentials.items()}
         tmp = self._cred_file + ".tmp"
-        with open(tmp, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         os.replace(tmp, self._cred_file)
         # Secure file permissions
         try:
@@ -11,10 +11,10 @@ import base64
 import json
 import logging
 import secrets
+import time
 import webbrowser
 from dataclasses import dataclass
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from threading import Thread
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlencode, urlparse, parse_qs
 
@@ -37,6 +37,30 @@ SUCCESS_HTML = b"""<!doctype html>
 </html>"""
 
 
+# Shared client for token-endpoint calls — refresh_token runs on hot paths
+# (every expiry check), so reuse the connection pool instead of paying a
+# TLS handshake per call.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared token-endpoint client (for shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 @dataclass
 class OAuthCredentials:
     access_token: str
@@ -52,16 +76,15 @@ def _decode_jwt_payload(token: str) -> dict[str, Any] | None:
         if len(parts) != 3:
             return None
         payload = parts[1]
-        # Add padding
-        padding = 4 - len(payload) % 4
-        if padding != 4:
-            payload += "=" * padding
-        decoded = base64.urlsafe_b64decode(payload)
+        # Add padding (branchless: -len % 4 is 0 when already aligned)
+        payload += "=" * (-len(payload) % 4)
+        decoded = base64.urlsafe_b64decode(payload.encode("ascii"))
         return json.loads(decoded)
     except Exception:
         return None
 
 
+@lru_cache(maxsize=64)
 def _extract_account_id(access_token: str) -> str | None:
     payload = _decode_jwt_payload(access_token)
     if payload is None:
@@ -74,101 +97,140 @@ def _extract_account_id(access_token: str) -> str | None:
     return None
 
 
-class _OAuthCallbackHandler(BaseHTTPRequestHandler):
-    """HTTP handler that captures the OAuth callback code."""
+class _CallbackServer:
+    """Minimal asyncio HTTP server that captures the OAuth callback code.
 
-    code: str | None = None
-    expected_state: str = ""
+    Runs on the login coroutine's own event loop, so no thread bridging
+    (or call_soon_threadsafe) is needed to signal completion.
+    """
+
+    def __init__(self, expected_state: str):
+        self._expected_state = expected_state
+        self.code: str | None = None
+        self.done = asyncio.Event()
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 1455) -> None:
+        self._server = await asyncio.start_server(self._handle, host, port)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+
+        request_line = request.split(b"\r\n", 1)[0].split(b" ")
+        path = request_line[1].decode("latin-1") if len(request_line) >= 2 else "/"
+        parsed = urlparse(path)
 
-    def do_GET(self) -> None:
-        parsed = urlparse(self.path)
         if parsed.path != "/auth/callback":
-            self.send_response(404)
-            self.end_headers()
-            self.wfile.write(b"Not found")
+            await self._respond(writer, b"404 Not Found", b"Not found")
             return
 
         params = parse_qs(parsed.query)
         state = params.get("state", [""])[0]
-        if state != self.expected_state:
-            self.send_response(400)
-            self.end_headers()
-            self.wfile.write(b"State mismatch")
+        if state != self._expected_state:
+            await self._respond(writer, b"400 Bad Request", b"State mismatch")
             return
 
         code = params.get("code", [""])[0]
         if not code:
-            self.send_response(400)
-            self.end_headers()
-            self.wfile.write(b"Missing authorization code")
+            await self._respond(
+                writer, b"400 Bad Request", b"Missing authorization code"
+            )
             return
 
-        _OAuthCallbackHandler.code = code
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(SUCCESS_HTML)
-
-    def log_message(self, format: str, *args: Any) -> None:
-        # Suppress default HTTP server logging
-        pass
+        self.code = code
+        await self._respond(
+            writer,
+            b"200 OK",
+            SUCCESS_HTML,
+            content_type=b"text/html; charset=utf-8",
+        )
+        self.done.set()
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: bytes,
+        body: bytes,
+        content_type: bytes = b"text/plain; charset=utf-8",
+    ) -> None:
+        writer.write(
+            b"HTTP/1.1 " + status + b"\r\n"
+            b"Content-Type: " + content_type + b"\r\n"
+            b"Content-Length: " + str(len(body)).encode("ascii") + b"\r\n"
+            b"Connection: close\r\n\r\n" + body
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
 
 
 async def _exchange_code(code: str, verifier: str) -> dict[str, Any] | None:
     """Exchange authorization code for tokens."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            TOKEN_URL,
-            data={
-                "grant_type": "authorization_code",
-                "client_id": CLIENT_ID,
-                "code": code,
-                "code_verifier": verifier,
-                "redirect_uri": REDIRECT_URI,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-        if resp.status_code != 200:
-            logger.error("Token exchange failed: %s %s", resp.status_code, resp.text)
-            return None
-        return resp.json()
+    client = _get_client()
+    resp = await client.post(
+        TOKEN_URL,
+        data={
+            "grant_type": "authorization_code",
+            "client_id": CLIENT_ID,
+            "code": code,
+            "code_verifier": verifier,
+            "redirect_uri": REDIRECT_URI,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    if resp.status_code != 200:
+        logger.error("Token exchange failed: %s %s", resp.status_code, resp.text)
+        return None
+    return resp.json()
 
 
 async def refresh_token(refresh: str) -> OAuthCredentials | None:
     """Refresh an OAuth access token."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            TOKEN_URL,
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": refresh,
-                "client_id": CLIENT_ID,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-        if resp.status_code != 200:
-            logger.error("Token refresh failed: %s %s", resp.status_code, resp.text)
-            return None
+    client = _get_client()
+    resp = await client.post(
+        TOKEN_URL,
+        data={
+            "grant_type": "refresh_token",
+            "refresh_token": refresh,
+            "client_id": CLIENT_ID,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    if resp.status_code != 200:
+        logger.error("Token refresh failed: %s %s", resp.status_code, resp.text)
+        return None
 
-        data = resp.json()
-        access = data.get("access_token")
-        new_refresh = data.get("refresh_token")
-        expires_in = data.get("expires_in", 3600)
+    data = resp.json()
+    access = data.get("access_token")
+    new_refresh = data.get("refresh_token")
+    expires_in = data.get("expires_in", 3600)
 
-        if not access or not new_refresh:
-            return None
+    if not access or not new_refresh:
+        return None
 
-        account_id = _extract_account_id(access)
-        if not account_id:
-            return None
+    account_id = _extract_account_id(access)
+    if not account_id:
+        return None
 
-        import time
-        return OAuthCredentials(
-            access_token=access,
-            refresh_token=new_refresh,
-            expires_at=time.time() + expires_in,
-            account_id=account_id,
-        )
+    return OAuthCredentials(
+        access_token=access,
+        refresh_token=new_refresh,
+        expires_at=time.time() + expires_in,
+        account_id=account_id,
+    )
 
 
 async def login_openai_oauth(manual_mode: bool = False) -> OAuthCredentials | None:
@@ -181,8 +243,6 @@ async def login_openai_oauth(manual_mode: bool = False) -> OAuthCredentials | No
     Returns:
         OAuthCredentials on success, None on failure.
     """
-    import time
-
     verifier, challenge = generate_pkce()
     state = secrets.token_hex(16)
 
@@ -201,12 +261,10 @@ async def login_openai_oauth(manual_mode: bool = False) -> OAuthCredentials | No
     }
     auth_url = f"{AUTHORIZE_URL}?{urlencode(params)}"
 
-    # Set up callback server
-    _OAuthCallbackHandler.code = None
-    _OAuthCallbackHandler.expected_state = state
-
+    # Set up callback server on the current event loop
+    server: _CallbackServer | None = _CallbackServer(state)
     try:
-        server = HTTPServer(("127.0.0.1", 1455), _OAuthCallbackHandler)
+        await server.start()
     except OSError as e:
         logger.error("Failed to bind port 1455: %s", e)
         logger.info("Falling back to manual mode")
@@ -215,10 +273,6 @@ async def login_openai_oauth(manual_mode: bool = False) -> OAuthCredentials | No
 
     code = None
 
-    if server:
-        server_thread = Thread(target=server.serve_forever, daemon=True)
-        server_thread.start()
-
     try:
         if manual_mode:
             print(f"\nOpen this URL in your browser:\n\n{auth_url}\n")
@@ -229,11 +283,11 @@ async def login_openai_oauth(manual_mode: bool = False) -> OAuthCredentials | No
             webbrowser.open(auth_url)
 
             # Wait for callback (up to 60 seconds)
-            for _ in range(600):
-                if _OAuthCallbackHandler.code:
-                    code = _OAuthCallbackHandler.code
-                    break
-                await asyncio.sleep(0.1)
+            try:
+                await asyncio.wait_for(server.done.wait(), timeout=60)
+                code = server.code
+            except asyncio.TimeoutError:
+                code = None
 
             if not code:
                 # Fallback to manual paste
@@ -242,7 +296,7 @@ async def login_openai_oauth(manual_mode: bool = False) -> OAuthCredentials | No
                 code = _parse_auth_input(code_input, state)
     finally:
         if server:
-            server.shutdown()
+            await server.close()
 
     if not code:
         logger.error("No authorization code received")
@@ -4,6 +4,9 @@ import base64
 import hashlib
 import secrets
 
+_sha256 = hashlib.sha256
+_b64url = base64.urlsafe_b64encode
+
 
 def generate_pkce() -> tuple[str, str]:
     """Generate PKCE code verifier and challenge.
@@ -11,14 +14,8 @@ def generate_pkce() -> tuple[str, str]:
     Returns:
         (verifier, challenge) tuple.
     """
-    verifier_bytes = secrets.token_bytes(32)
-    verifier = _base64url_encode(verifier_bytes)
-
-    challenge_bytes = hashlib.sha256(verifier.encode("ascii")).digest()
-    challenge = _base64url_encode(challenge_bytes)
-
-    return verifier, challenge
-
-
-def _base64url_encode(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+    # Keep the base64url verifier in bytes form so the RFC 7636 challenge
+    # (sha256 over the verifier *string*) hashes it without a str round-trip.
+    verifier_bytes = _b64url(secrets.token_bytes(32)).rstrip(b"=")
+    challenge_bytes = _b64url(_sha256(verifier_bytes).digest()).rstrip(b"=")
+    return verifier_bytes.decode("ascii"), challenge_bytes.decode("ascii")
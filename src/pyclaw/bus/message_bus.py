@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Sequence
 
 from pyclaw.models import InboundMessage, OutboundMessage
 
@@ -34,6 +35,17 @@ class MessageBus:
         if not self._closed:
             await self._outbound.put(msg)
 
+    async def publish_outbound_many(self, msgs: Sequence[OutboundMessage]) -> None:
+        """Publish a batch of outbound messages in one call.
+
+        Amortizes per-message publish overhead when a turn produces
+        multi-part responses (progress updates, split replies).
+        """
+        if self._closed:
+            return
+        for msg in msgs:
+            await self._outbound.put(msg)
+
     async def consume_outbound(self) -> OutboundMessage | None:
         if self._closed:
             return None
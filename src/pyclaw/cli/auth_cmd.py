@@ -7,9 +7,6 @@ from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
 
-from pyclaw.config import load_config
-from pyclaw.config.loader import save_config
-
 console = Console()
 auth_app = typer.Typer(name="auth", help="Manage authentication credentials")
 
@@ -21,6 +18,9 @@ def login(
     ),
 ) -> None:
     """Login to an LLM provider."""
+    from pyclaw.config import load_config
+    from pyclaw.config.loader import save_config
+
     cfg = load_config()
 
     api_key = Prompt.ask(f"Enter API key for {provider}")
@@ -59,6 +59,9 @@ def logout(
     ),
 ) -> None:
     """Remove stored credentials."""
+    from pyclaw.config import load_config
+    from pyclaw.config.loader import save_config
+
     cfg = load_config()
 
     if provider:
@@ -75,6 +78,8 @@ def logout(
 @auth_app.command("status")
 def auth_status() -> None:
     """Show authentication status for all providers."""
+    from pyclaw.config import load_config
+
     cfg = load_config()
     table = Table(title="Authentication Status")
     table.add_column("Provider", style="cyan")
@@ -10,6 +10,15 @@ from rich.console import Console
 
 from pyclaw import __version__
 
+# Prefer uvloop when available — SSE streaming fires thousands of small
+# reads per response and benefits from libuv's lower dispatch overhead.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 app = typer.Typer(
     name="pyclaw",
     help="Ultra-lightweight personal AI assistant",
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from threading import Thread
+from typing import Callable
 
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
@@ -14,19 +17,21 @@ from pyclaw.config.models import Config, ProviderConfig
 
 console = Console()
 
-_VALID_MODELS = {
-    "openai": ["gpt-5.3-codex", "gpt-5.3-codex-spark", "gpt-4o", "gpt-4o-mini", "gpt-4.1", "gpt-4.1-mini", "gpt-4.1-nano", "o3-mini", "o4-mini"],
-    "anthropic": [
+# Ordered tuples for display; frozensets for O(1) membership checks.
+_VALID_MODELS_DISPLAY = {
+    "openai": ("gpt-5.3-codex", "gpt-5.3-codex-spark", "gpt-4o", "gpt-4o-mini", "gpt-4.1", "gpt-4.1-mini", "gpt-4.1-nano", "o3-mini", "o4-mini"),
+    "anthropic": (
         "anthropic/claude-opus-4-6",
         "anthropic/claude-sonnet-4-6",
         "anthropic/claude-haiku-4-5",
-    ],
-    "ollama": ["ollama/llama3", "ollama/llama3:70b", "ollama/mistral", "ollama/codellama"],
-    "openrouter": [
+    ),
+    "ollama": ("ollama/llama3", "ollama/llama3:70b", "ollama/mistral", "ollama/codellama"),
+    "openrouter": (
         "openrouter/anthropic/claude-sonnet-4-6",
         "openrouter/meta-llama/llama-3-70b",
-    ],
+    ),
 }
+_VALID_MODELS = {k: frozenset(v) for k, v in _VALID_MODELS_DISPLAY.items()}
 
 
 def _mask_key(key: str) -> str:
@@ -36,13 +41,19 @@ def _mask_key(key: str) -> str:
     return f"{key[:4]}...{key[-4:]}"
 
 
+# parents=True on the subdirs creates the workspace root in the same pass
+_WORKSPACE_SUBDIRS = ("memory", "sessions", "skills")
+
+_DEFAULT_MODELS = {
+    "openai": "gpt-5.3-codex",
+    "anthropic": "anthropic/claude-sonnet-4-6",
+    "ollama": "ollama/llama3",
+    "openrouter": "openrouter/meta-llama/llama-3-70b",
+}
+
+
 def _default_model(provider: str) -> str:
-    return {
-        "openai": "gpt-5.3-codex",
-        "anthropic": "anthropic/claude-sonnet-4-6",
-        "ollama": "ollama/llama3",
-        "openrouter": "openrouter/meta-llama/llama-3-70b",
-    }.get(provider, "gpt-4o")
+    return _DEFAULT_MODELS.get(provider, "gpt-4o")
 
 
 def _detect_current_provider(cfg: Config) -> str | None:
@@ -67,8 +78,24 @@ def _detect_current_provider(cfg: Config) -> str | None:
 
 
 
+def _warm_imports() -> None:
+    """Pre-import the heavy modules the OAuth step needs.
+
+    Runs on a background thread while the user answers the wizard
+    prompts, so selecting browser login does not stall on import.
+    """
+    try:
+        import httpx  # noqa: F401
+
+        import pyclaw.auth.openai_oauth  # noqa: F401
+    except Exception:  # pragma: no cover - warming is best-effort
+        pass
+
+
 def run_onboard() -> None:
     """Interactive setup wizard for pyclaw."""
+    Thread(target=_warm_imports, daemon=True).start()
+
     console.print(Panel("[bold]Welcome to pyclaw![/bold]\n\nLet's set you up.", title="Setup Wizard"))
 
     config_dir = Path.home() / ".pyclaw"
@@ -155,9 +182,9 @@ def run_onboard() -> None:
 
     default_model = _default_model(provider)
     current_model = cfg.agents.defaults.model
-    valid = _VALID_MODELS.get(provider, [])
+    valid = _VALID_MODELS.get(provider, frozenset())
     if valid:
-        console.print(f"  [dim]Known models: {', '.join(valid)}[/dim]")
+        console.print(f"  [dim]Known models: {', '.join(_VALID_MODELS_DISPLAY[provider])}[/dim]")
     model = Prompt.ask("Default model", default=current_model if current_model != "gpt-4o" else default_model)
 
     if valid and model not in valid:
@@ -176,29 +203,23 @@ def run_onboard() -> None:
 
     # ── Create workspace ──────────────────────────────────────────────
     workspace = Path(cfg.agents.defaults.workspace).expanduser()
-    workspace.mkdir(parents=True, exist_ok=True)
-    (workspace / "memory").mkdir(exist_ok=True)
-    (workspace / "sessions").mkdir(exist_ok=True)
-    (workspace / "skills").mkdir(exist_ok=True)
+    for sub in _WORKSPACE_SUBDIRS:
+        (workspace / sub).mkdir(parents=True, exist_ok=True)
 
     # Write identity files
-    identity_content = _build_identity(agent_name, use_case)
-    soul_content = _build_soul(personality, use_case)
-    agent_content = _build_agent(use_case, extra_instructions)
-    user_content = _build_user(user_name, user_address, user_role)
+    identity_files = [
+        (workspace / "IDENTITY.md", _build_identity(agent_name, use_case)),
+        (workspace / "SOUL.md", _build_soul(personality, use_case)),
+        (workspace / "AGENT.md", _build_agent(use_case, extra_instructions)),
+        (workspace / "USER.md", _build_user(user_name, user_address, user_role)),
+    ]
 
     if is_rerun:
         regen = Confirm.ask("Regenerate workspace files?", default=False)
         if regen:
-            _write_file(workspace / "IDENTITY.md", identity_content)
-            _write_file(workspace / "SOUL.md", soul_content)
-            _write_file(workspace / "AGENT.md", agent_content)
-            _write_file(workspace / "USER.md", user_content)
+            asyncio.run(_write_files(_write_file, identity_files))
     else:
-        _write_if_missing(workspace / "IDENTITY.md", identity_content)
-        _write_if_missing(workspace / "SOUL.md", soul_content)
-        _write_if_missing(workspace / "AGENT.md", agent_content)
-        _write_if_missing(workspace / "USER.md", user_content)
+        asyncio.run(_write_files(_write_if_missing, identity_files))
 
     # Save config
     save_config(cfg)
@@ -265,9 +286,8 @@ def _setup_openai(cfg: Config, config_dir: Path) -> None:
                 return
         console.print("\n[bold]Starting OpenAI OAuth login...[/bold]")
         console.print("[dim]This uses your ChatGPT Pro/Plus subscription (separate from API billing).[/dim]\n")
-        import asyncio
         from pyclaw.auth.openai_oauth import login_openai_oauth
-        oauth_creds = asyncio.get_event_loop().run_until_complete(login_openai_oauth())
+        oauth_creds = asyncio.run(login_openai_oauth())
         if oauth_creds:
             cred_store.store_oauth("openai-codex", oauth_creds)
             console.print("[green]OAuth login successful![/green]")
@@ -462,6 +482,16 @@ def _write_file(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+async def _write_files(
+    writer: Callable[[Path, str], None],
+    files: list[tuple[Path, str]],
+) -> None:
+    """Write workspace files concurrently — latency is max(file), not sum."""
+    await asyncio.gather(
+        *(asyncio.to_thread(writer, path, content) for path, content in files)
+    )
+
+
 def _build_identity(agent_name: str, use_case: str) -> str:
     return f"""# Identity
 
@@ -1,5 +1,6 @@
 """Configuration data models for pyclaw."""
 
+from functools import cached_property
 from pathlib import Path
 from typing import Any, List, Optional
 
@@ -37,6 +38,7 @@ class AgentDefaults(BaseModel):
     max_tokens: int = 8192
     temperature: Optional[float] = 0.7
     max_tool_iterations: int = 20
+    history_window: int = 20
 
 
 class AgentsConfig(BaseModel):
@@ -79,6 +81,7 @@ class ProviderConfig(BaseModel):
 
 class OpenAIProviderConfig(ProviderConfig):
     web_search: bool = False
+    cache_responses: bool = False
 
 
 class ProvidersConfig(BaseModel):
@@ -227,6 +230,11 @@ class Config(BaseModel):
     def config_dir(self) -> Path:
         return Path.home() / ".pyclaw"
 
+    @cached_property
+    def model_index(self) -> dict[str, ModelConfig]:
+        """model_name → ModelConfig lookup, built once per Config."""
+        return {mc.model_name: mc for mc in self.model_list}
+
     @property
     def default_workspace(self) -> Path:
         ws = self.agents.defaults.workspace
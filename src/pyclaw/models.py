@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # ── LLM Messages & Tool Calls ──────────────────────────────────────────────
@@ -25,12 +25,32 @@ class ToolCall(BaseModel):
     arguments: dict[str, Any] = Field(default_factory=dict)
 
 
+# Max characters of a message shown in summarization prompts
+_PREVIEW_LEN = 500
+
+
 class Message(BaseModel):
     role: str  # "system", "user", "assistant", "tool"
     content: str = ""
     tool_calls: list[ToolCall] = Field(default_factory=list)
     tool_call_id: str = ""
 
+    _preview: str | None = PrivateAttr(default=None)
+
+    @property
+    def preview(self) -> str:
+        """First 500 chars of content, sliced once and cached.
+
+        Summarization may walk the same messages repeatedly; the cached
+        slice avoids re-allocating a new str each pass. Not serialized.
+        """
+        if self._preview is None:
+            content = self.content
+            self._preview = (
+                content if len(content) <= _PREVIEW_LEN else content[:_PREVIEW_LEN]
+            )
+        return self._preview
+
 
 class UsageInfo(BaseModel):
     prompt_tokens: int = 0
@@ -57,6 +57,14 @@ class Tool(ABC):
     async def execute(self, args: dict[str, Any]) -> ToolResult:
         ...
 
+    def cacheable(self) -> bool:
+        """Whether identical calls may be served from a short-lived cache.
+
+        Only read-only, idempotent tools should opt in; mutating tools
+        keep the default False.
+        """
+        return False
+
 
 class ContextualTool(Tool):
     """Tool that receives channel/chat context."""
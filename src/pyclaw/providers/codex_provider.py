@@ -9,13 +9,17 @@ and accumulate the full response.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
+import os
 import platform
 import time
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable
 
 import httpx
+import orjson
 
 from pyclaw.models import (
     LLMResponse,
@@ -33,6 +37,140 @@ DEFAULT_BASE_URL = "https://chatgpt.com/backend-api"
 MAX_RETRIES = 3
 BASE_DELAY_S = 1.0
 
+# platform.* can shell out to uname on some systems — probe once at import.
+_UA = f"pyclaw ({platform.system()} {platform.release()}; {platform.machine()})"
+
+# Everything except the per-instance credential headers
+_STATIC_HEADERS = {
+    "OpenAI-Beta": "responses=experimental",
+    "originator": "pyclaw",
+    "User-Agent": _UA,
+    "Content-Type": "application/json",
+    "Accept": "text/event-stream",
+}
+
+# Cap concurrent in-flight requests across all provider instances —
+# uncontrolled bursts from parallel chat() calls just trade throughput
+# for 429 retries.
+_CODEX_SEM = asyncio.Semaphore(int(os.environ.get("PYCLAW_CODEX_CONCURRENCY", "8")))
+
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRYABLE_NEEDLES = (
+    "rate limit",
+    "rate_limit",
+    "ratelimit",
+    "overloaded",
+    "service unavailable",
+    "service_unavailable",
+    "upstream connect",
+    "upstream_connect",
+)
+
+
+class _PendingCall:
+    """Accumulator for a function call being streamed across events."""
+
+    __slots__ = ("id", "name", "arg_parts")
+
+    def __init__(self, call_id: str, name: str = "") -> None:
+        self.id = call_id
+        self.name = name
+        self.arg_parts: list[str] = []
+
+
+# Per-event handlers for the SSE dispatch table. Each receives the decoded
+# event plus the three accumulators owned by _stream_request; one hashed
+# lookup replaces the former if/elif chain of string compares.
+_EventHandler = Callable[
+    [dict[str, Any], list[str], dict[str, _PendingCall], dict[str, Any]], None
+]
+
+
+def _on_error(
+    event: dict[str, Any],
+    content_parts: list[str],
+    pending: dict[str, _PendingCall],
+    state: dict[str, Any],
+) -> None:
+    msg = event.get("message", event.get("code", "Unknown error"))
+    raise RuntimeError(f"Codex stream error: {msg}")
+
+
+def _on_failed(
+    event: dict[str, Any],
+    content_parts: list[str],
+    pending: dict[str, _PendingCall],
+    state: dict[str, Any],
+) -> None:
+    err = event.get("response", {}).get("error", {})
+    raise RuntimeError(err.get("message", "Response failed"))
+
+
+def _on_text_delta(
+    event: dict[str, Any],
+    content_parts: list[str],
+    pending: dict[str, _PendingCall],
+    state: dict[str, Any],
+) -> None:
+    delta = event.get("delta")
+    if delta:
+        content_parts.append(delta)
+
+
+def _on_arguments_delta(
+    event: dict[str, Any],
+    content_parts: list[str],
+    pending: dict[str, _PendingCall],
+    state: dict[str, Any],
+) -> None:
+    item_id = event.get("item_id", "")
+    if item_id not in pending:
+        pending[item_id] = _PendingCall(item_id)
+    # Collected as chunks and joined once at the end — += on str is
+    # quadratic over argument length.
+    pending[item_id].arg_parts.append(event.get("delta", ""))
+
+
+def _on_item_added(
+    event: dict[str, Any],
+    content_parts: list[str],
+    pending: dict[str, _PendingCall],
+    state: dict[str, Any],
+) -> None:
+    item = event.get("item", {})
+    if item.get("type") == "function_call":
+        # `or` chains keep the fallback gets lazy — dict.get's default
+        # argument would evaluate the inner lookup eagerly.
+        item_id = item.get("id") or item.get("call_id") or ""
+        pending[item_id] = _PendingCall(item.get("call_id") or item_id, item.get("name", ""))
+
+
+def _on_completed(
+    event: dict[str, Any],
+    content_parts: list[str],
+    pending: dict[str, _PendingCall],
+    state: dict[str, Any],
+) -> None:
+    response_obj = event.get("response", {})
+    usage = response_obj.get("usage", {})
+    if usage:
+        state["usage"]["input"] = usage.get("input_tokens", 0)
+        state["usage"]["output"] = usage.get("output_tokens", 0)
+    status = response_obj.get("status", "completed")
+    if status != "completed":
+        state["stop_reason"] = status
+
+
+_EVENT_HANDLERS: dict[str, _EventHandler] = {
+    "error": _on_error,
+    "response.failed": _on_failed,
+    "response.output_text.delta": _on_text_delta,
+    "response.function_call_arguments.delta": _on_arguments_delta,
+    "response.output_item.added": _on_item_added,
+    "response.completed": _on_completed,
+    "response.done": _on_completed,
+}
+
 
 class CodexProvider(LLMProvider):
     """OpenAI Codex provider using the Responses API with OAuth tokens."""
@@ -43,15 +181,42 @@ class CodexProvider(LLMProvider):
         account_id: str,
         base_url: str = DEFAULT_BASE_URL,
         default_model: str = "gpt-5.3-codex",
+        cache_dir: Path | None = None,
     ) -> None:
         self._access_token = access_token
         self._account_id = account_id
         self._base_url = base_url.rstrip("/")
         self._default_model = default_model
+        self._cache_dir = cache_dir
+        self._client: httpx.AsyncClient | None = None
+        # Converted tool payload for the last tools list seen. The tool
+        # registry memoizes get_definitions(), so agent loops pass the
+        # same list object every turn and this hits after the first call.
+        self._tools_cache: tuple[int, list[dict[str, Any]]] | None = None
+        # Headers are identical for every request — build them once.
+        self._base_headers = _STATIC_HEADERS | {
+            "Authorization": f"Bearer {access_token}",
+            "chatgpt-account-id": account_id,
+        }
 
     def get_default_model(self) -> str:
         return self._default_model
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled client shared across chat calls."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(120.0, connect=30.0),
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client (for provider shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def chat(
         self,
         messages: list[Message],
@@ -63,8 +228,7 @@ class CodexProvider(LLMProvider):
         url = f"{self._base_url}/codex/responses"
 
         # Convert messages to Responses API format
-        input_msgs = _convert_messages(messages)
-        system_prompt = _extract_system_prompt(messages)
+        input_msgs, system_prompt = _build_input(messages)
 
         body: dict[str, Any] = {
             "model": model or self._default_model,
@@ -79,31 +243,46 @@ class CodexProvider(LLMProvider):
             body["instructions"] = system_prompt
 
         if tools:
-            body["tools"] = _convert_tools(tools)
+            cached_tools = self._tools_cache
+            if cached_tools is not None and cached_tools[0] == id(tools):
+                body["tools"] = cached_tools[1]
+            else:
+                converted = _convert_tools(tools)
+                self._tools_cache = (id(tools), converted)
+                body["tools"] = converted
 
         # Note: Codex API does not support temperature or max_tokens parameters
 
-        headers = self._build_headers()
-        headers["Accept"] = "text/event-stream"
+        headers = self._base_headers
+
+        # Content-addressed response cache — the Codex API takes no
+        # sampling parameters, so identical bodies are safe to replay.
+        cache_path: Path | None = None
+        if self._cache_dir is not None:
+            key = hashlib.sha256(
+                orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
+            ).hexdigest()
+            cache_path = self._cache_dir / f"{key}.json"
+            cached = _load_cached_response(cache_path)
+            if cached is not None:
+                return cached
 
         # Retry loop for transient errors
-        last_error: Exception | None = None
-        for attempt in range(MAX_RETRIES + 1):
+        attempt = 0
+        while True:
             try:
-                return await self._stream_request(url, body, headers)
+                async with _CODEX_SEM:
+                    response = await self._stream_request(url, body, headers)
+                if cache_path is not None:
+                    _store_cached_response(cache_path, response)
+                return response
             except _RetryableError as e:
-                last_error = e
-                if attempt < MAX_RETRIES:
-                    delay = BASE_DELAY_S * (2 ** attempt)
-                    logger.warning("Codex request failed (attempt %d), retrying in %.1fs: %s", attempt + 1, delay, e)
-                    import asyncio
-                    await asyncio.sleep(delay)
-                    continue
-                raise RuntimeError(str(e)) from e
-            except RuntimeError:
-                raise
-
-        raise RuntimeError(str(last_error) if last_error else "Codex request failed")
+                if attempt == MAX_RETRIES:
+                    raise RuntimeError(str(e)) from e
+                delay = BASE_DELAY_S * (2 ** attempt)
+                logger.warning("Codex request failed (attempt %d), retrying in %.1fs: %s", attempt + 1, delay, e)
+                await asyncio.sleep(delay)
+                attempt += 1
 
     async def _stream_request(
         self,
@@ -113,25 +292,44 @@ class CodexProvider(LLMProvider):
     ) -> LLMResponse:
         """Send a streaming request and accumulate the SSE response."""
         content_parts: list[str] = []
-        tool_calls_by_idx: dict[str, dict[str, str]] = {}
-        usage_data: dict[str, int] = {}
-        stop_reason = "stop"
-
-        async with httpx.AsyncClient(timeout=httpx.Timeout(120.0, connect=30.0)) as client:
-            async with client.stream("POST", url, json=body, headers=headers) as resp:
-                if resp.status_code != 200:
-                    error_text = await resp.aread()
-                    error_str = error_text.decode(errors="replace")
-                    if _is_retryable(resp.status_code, error_str):
-                        raise _RetryableError(f"Codex API error {resp.status_code}: {error_str[:300]}")
-                    _raise_friendly_error(resp.status_code, error_str)
-
-                buffer = ""
-                async for chunk in resp.aiter_text():
-                    buffer += chunk
-
-                    while "\n\n" in buffer:
-                        event_text, buffer = buffer.split("\n\n", 1)
+        tool_calls_by_idx: dict[str, _PendingCall] = {}
+        state: dict[str, Any] = {"usage": {}, "stop_reason": "stop"}
+
+        client = self._get_client()
+        # orjson serializes the body (often tens of KB of history + tool
+        # schemas) several times faster than httpx's stdlib json= path;
+        # Content-Type is already set in the base headers.
+        async with client.stream(
+            "POST", url, content=orjson.dumps(body), headers=headers
+        ) as resp:
+            if resp.status_code != 200:
+                error_text = await resp.aread()
+                error_str = error_text.decode(errors="replace")
+                if _is_retryable(resp.status_code, error_str):
+                    raise _RetryableError(f"Codex API error {resp.status_code}: {error_str[:300]}")
+                _raise_friendly_error(resp.status_code, error_str)
+
+            # Accumulate raw bytes and carve out complete events in
+            # place — one decode per event instead of per network
+            # chunk, and no quadratic str re-concatenation.
+            buffer = bytearray()
+            # Bind hot lookups to locals — the loop body runs once per
+            # delta, which can be thousands of times per response.
+            extend = buffer.extend
+            find = buffer.find
+            loads = orjson.loads
+            get_handler = _EVENT_HANDLERS.get
+            async for chunk in resp.aiter_bytes():
+                extend(chunk)
+
+                while (idx := find(b"\n\n")) != -1:
+                    event_text = bytes(buffer[:idx]).decode("utf-8", "replace")
+                    del buffer[: idx + 2]
+                    # Codex events are almost always a single "data:" line —
+                    # slice it directly rather than split + rejoin.
+                    if event_text.startswith("data:") and "\n" not in event_text:
+                        data_str = event_text[5:].strip()
+                    else:
                         data_lines = [
                             line[5:].strip()
                             for line in event_text.split("\n")
@@ -140,80 +338,38 @@ class CodexProvider(LLMProvider):
                         if not data_lines:
                             continue
                         data_str = "\n".join(data_lines).strip()
-                        if not data_str or data_str == "[DONE]":
-                            continue
+                    if not data_str or data_str == "[DONE]":
+                        continue
 
-                        try:
-                            event = json.loads(data_str)
-                        except json.JSONDecodeError:
-                            continue
+                    try:
+                        event = loads(data_str)
+                    except orjson.JSONDecodeError:
+                        continue
 
-                        event_type = event.get("type", "")
-
-                        # Handle errors from the stream
-                        if event_type == "error":
-                            msg = event.get("message", event.get("code", "Unknown error"))
-                            raise RuntimeError(f"Codex stream error: {msg}")
-
-                        if event_type == "response.failed":
-                            err = event.get("response", {}).get("error", {})
-                            msg = err.get("message", "Response failed")
-                            raise RuntimeError(msg)
-
-                        # Text content deltas
-                        if event_type == "response.output_text.delta":
-                            delta = event.get("delta", "")
-                            if delta:
-                                content_parts.append(delta)
-
-                        # Function call arguments delta
-                        elif event_type == "response.function_call_arguments.delta":
-                            item_id = event.get("item_id", "")
-                            delta = event.get("delta", "")
-                            if item_id not in tool_calls_by_idx:
-                                tool_calls_by_idx[item_id] = {"id": item_id, "name": "", "arguments": ""}
-                            tool_calls_by_idx[item_id]["arguments"] += delta
-
-                        # Output item added (captures function call name)
-                        elif event_type == "response.output_item.added":
-                            item = event.get("item", {})
-                            if item.get("type") == "function_call":
-                                item_id = item.get("id", item.get("call_id", ""))
-                                tool_calls_by_idx[item_id] = {
-                                    "id": item.get("call_id", item_id),
-                                    "name": item.get("name", ""),
-                                    "arguments": "",
-                                }
-
-                        # Response completed — extract usage
-                        elif event_type in ("response.completed", "response.done"):
-                            response_obj = event.get("response", {})
-                            usage = response_obj.get("usage", {})
-                            if usage:
-                                usage_data["input"] = usage.get("input_tokens", 0)
-                                usage_data["output"] = usage.get("output_tokens", 0)
-                            status = response_obj.get("status", "completed")
-                            if status != "completed":
-                                stop_reason = status
+                    handler = get_handler(event.get("type"))
+                    if handler is not None:
+                        handler(event, content_parts, tool_calls_by_idx, state)
 
         # Build final response
         content = "".join(content_parts)
-        tool_call_list = []
-        for tc_data in tool_calls_by_idx.values():
-            tool_call_list.append(ToolCall(
-                id=tc_data["id"],
+        tool_call_list = [
+            ToolCall(
+                id=pending.id,
                 function=FunctionCall(
-                    name=tc_data["name"],
-                    arguments=tc_data["arguments"] or "{}",
+                    name=pending.name,
+                    arguments="".join(pending.arg_parts) or "{}",
                 ),
-            ))
+            )
+            for pending in tool_calls_by_idx.values()
+        ]
 
+        usage_data = state["usage"]
         usage = UsageInfo(
             prompt_tokens=usage_data.get("input", 0),
             completion_tokens=usage_data.get("output", 0),
         ) if usage_data else None
 
-        finish_reason = "tool_calls" if tool_call_list else stop_reason
+        finish_reason = "tool_calls" if tool_call_list else state["stop_reason"]
 
         return LLMResponse(
             content=content,
@@ -222,60 +378,61 @@ class CodexProvider(LLMProvider):
             finish_reason=finish_reason,
         )
 
-    def _build_headers(self) -> dict[str, str]:
-        ua = f"pyclaw ({platform.system()} {platform.release()}; {platform.machine()})"
-        return {
-            "Authorization": f"Bearer {self._access_token}",
-            "chatgpt-account-id": self._account_id,
-            "OpenAI-Beta": "responses=experimental",
-            "originator": "pyclaw",
-            "User-Agent": ua,
-            "Content-Type": "application/json",
-        }
-
-
 class _RetryableError(Exception):
     """Raised for transient errors that should be retried."""
     pass
 
 
+def _load_cached_response(path: Path) -> LLMResponse | None:
+    try:
+        return LLMResponse.model_validate(orjson.loads(path.read_bytes()))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.debug("Ignoring unreadable response cache entry: %s", path)
+        return None
+
+
+def _store_cached_response(path: Path, response: LLMResponse) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(orjson.dumps(response.model_dump()))
+    except OSError:
+        logger.debug("Failed to write response cache entry: %s", path)
+
+
 def _is_retryable(status: int, error_text: str) -> bool:
-    if status in (429, 500, 502, 503, 504):
+    if status in _RETRYABLE_STATUSES:
         return True
-    import re
-    return bool(re.search(r"rate.?limit|overloaded|service.?unavailable|upstream.?connect", error_text, re.IGNORECASE))
+    # Plain substring scans beat the regex engine for these short needles;
+    # the interesting cues always appear near the front of the body.
+    text = error_text[:200].lower()
+    return any(needle in text for needle in _RETRYABLE_NEEDLES)
 
 
 def _raise_friendly_error(status: int, error_text: str) -> None:
     """Parse error response and raise a friendly RuntimeError."""
     try:
-        data = json.loads(error_text)
-        err = data.get("error", {})
-        code = err.get("code", "")
-        if "usage_limit" in code or status == 429:
-            plan = err.get("plan_type", "")
-            resets = err.get("resets_at")
-            msg = "ChatGPT usage limit reached"
-            if plan:
-                msg += f" ({plan} plan)"
-            if resets:
-                mins = max(0, round((resets * 1000 - time.time() * 1000) / 60000))
-                msg += f". Try again in ~{mins} min"
-            raise RuntimeError(msg)
-        if err.get("message"):
-            raise RuntimeError(f"Codex API error: {err['message']}")
-    except (json.JSONDecodeError, RuntimeError):
-        raise
+        err = orjson.loads(error_text).get("error", {})
+    except (orjson.JSONDecodeError, AttributeError):
+        # Non-JSON (or non-object) body — fall through to the generic error
+        err = {}
+
+    if "usage_limit" in err.get("code", "") or status == 429:
+        plan = err.get("plan_type", "")
+        resets = err.get("resets_at")
+        msg = "ChatGPT usage limit reached"
+        if plan:
+            msg += f" ({plan} plan)"
+        if resets:
+            mins = max(0, round((resets - time.time()) / 60))
+            msg += f". Try again in ~{mins} min"
+        raise RuntimeError(msg)
+    if err.get("message"):
+        raise RuntimeError(f"Codex API error: {err['message']}")
     raise RuntimeError(f"Codex API error {status}: {error_text[:500]}")
 
 
-def _extract_system_prompt(messages: list[Message]) -> str:
-    for msg in messages:
-        if msg.role == "system":
-            return msg.content
-    return ""
-
-
 def _ensure_fc_prefix(call_id: str) -> str:
     """Ensure a function call ID has the 'fc_' prefix required by the Codex API."""
     if call_id.startswith("fc_"):
@@ -286,61 +443,70 @@ def _ensure_fc_prefix(call_id: str) -> str:
     return "fc_" + call_id
 
 
-def _convert_messages(messages: list[Message]) -> list[dict[str, Any]]:
-    """Convert internal messages to Responses API input format."""
-    result = []
+def _build_input(messages: list[Message]) -> tuple[list[dict[str, Any]], str]:
+    """Convert internal messages to Responses API input format.
+
+    Returns the input list plus the first system prompt, gathered in the
+    same pass so long histories are only walked once.
+    """
+    result: list[dict[str, Any]] = []
+    system_prompt = ""
     # Map original IDs → fc_ IDs for consistency between calls and outputs
     id_map: dict[str, str] = {}
 
     for msg in messages:
-        if msg.role == "system":
-            continue
-
-        if msg.role == "user":
-            result.append({"role": "user", "content": msg.content})
-
-        elif msg.role == "assistant":
-            # Text content goes in the assistant message
-            if msg.content:
-                result.append({
-                    "role": "assistant",
-                    "content": [{"type": "output_text", "text": msg.content}],
-                })
-            # Function calls are top-level input items (not nested in content)
-            if msg.tool_calls:
-                for tc in msg.tool_calls:
-                    fn = tc.function
-                    if fn:
-                        fc_id = _ensure_fc_prefix(tc.id)
-                        id_map[tc.id] = fc_id
-                        result.append({
+        match msg.role:
+            case "system":
+                if not system_prompt:
+                    system_prompt = msg.content
+
+            case "user":
+                result.append({"role": "user", "content": msg.content})
+
+            case "assistant":
+                # Pydantic attribute access is a descriptor call — read each
+                # field once per message.
+                content = msg.content
+                tool_calls = msg.tool_calls
+                # Text content goes in the assistant message
+                if content:
+                    result.append({
+                        "role": "assistant",
+                        "content": [{"type": "output_text", "text": content}],
+                    })
+                # Function calls are top-level input items (not nested in content)
+                if tool_calls:
+                    result.extend(
+                        {
                             "type": "function_call",
-                            "id": fc_id,
+                            "id": (fc_id := id_map.setdefault(tc.id, _ensure_fc_prefix(tc.id))),
                             "call_id": fc_id,
                             "name": fn.name,
                             "arguments": fn.arguments or "{}",
-                        })
-
-        elif msg.role == "tool":
-            original_id = msg.tool_call_id or ""
-            fc_id = id_map.get(original_id, _ensure_fc_prefix(original_id))
-            result.append({
-                "type": "function_call_output",
-                "call_id": fc_id,
-                "output": msg.content,
-            })
+                        }
+                        for tc in tool_calls
+                        if (fn := tc.function)
+                    )
+
+            case "tool":
+                original_id = msg.tool_call_id or ""
+                fc_id = id_map.get(original_id, _ensure_fc_prefix(original_id))
+                result.append({
+                    "type": "function_call_output",
+                    "call_id": fc_id,
+                    "output": msg.content,
+                })
 
-    return result
+    return result, system_prompt
 
 
 def _convert_tools(tools: list[ToolDefinition]) -> list[dict[str, Any]]:
-    result = []
-    for tool in tools:
-        fn = tool.function
-        result.append({
+    return [
+        {
             "type": "function",
-            "name": fn.name,
+            "name": (fn := tool.function).name,
             "description": fn.description,
             "parameters": fn.parameters,
-        })
-    return result
+        }
+        for tool in tools
+    ]
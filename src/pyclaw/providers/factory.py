@@ -3,16 +3,79 @@
 from __future__ import annotations
 
 import logging
+import os
+from functools import cache
 from typing import Any
 
-from pyclaw.config.models import Config, ModelConfig, ProvidersConfig
+from pyclaw.config.models import Config, ProvidersConfig
 from pyclaw.protocols import LLMProvider
 
 logger = logging.getLogger(__name__)
 
-# Provider prefix → protocol mapping
-ANTHROPIC_PREFIXES = ("anthropic/", "claude")
-COPILOT_PREFIXES = ("copilot/",)
+
+# Lazy imports cached after the first call — keeps module import light
+# without paying the sys.modules lookup on every provider creation.
+@cache
+def _openai_provider_cls() -> type[LLMProvider]:
+    from pyclaw.providers.openai_provider import OpenAIProvider
+
+    return OpenAIProvider
+
+
+@cache
+def _anthropic_provider_cls() -> type[LLMProvider]:
+    from pyclaw.providers.anthropic_provider import AnthropicProvider
+
+    return AnthropicProvider
+
+
+@cache
+def _codex_provider_cls() -> type[LLMProvider]:
+    from pyclaw.providers.codex_provider import CodexProvider
+
+    return CodexProvider
+
+
+# config dir → (credentials.json mtime_ns, store). Validated against the
+# file mtime on every lookup so logins from another process are noticed
+# while the happy path stays a stat + dict hit instead of a JSON parse.
+_STORE_CACHE: dict[str, tuple[int, "CredentialStore"]] = {}
+
+
+def _credential_store(config_dir: str) -> "CredentialStore":
+    from pyclaw.auth.credentials import CredentialStore
+
+    try:
+        mtime = os.stat(os.path.join(config_dir, "credentials.json")).st_mtime_ns
+    except OSError:
+        mtime = -1
+
+    cached = _STORE_CACHE.get(config_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    store = CredentialStore(config_dir)
+    _STORE_CACHE[config_dir] = (mtime, store)
+    return store
+
+# Provider prefix (the token before "/") → protocol
+_PROTOCOL_BY_PREFIX = {
+    "anthropic": "anthropic",
+    "copilot": "copilot",
+}
+
+# Prefixes stripped before handing the model id to the OpenAI provider
+_OPENAI_STRIP_PREFIXES = frozenset(
+    {"openai", "openrouter", "groq", "ollama", "deepseek", "gemini", "qwen"}
+)
+
+# Prefix → (providers attribute, default api_base) for key resolution
+_OPENAI_PREFIX_TABLE = {
+    "openrouter": ("openrouter", "https://openrouter.ai/api/v1"),
+    "groq": ("groq", "https://api.groq.com/openai/v1"),
+    "ollama": ("ollama", "http://localhost:11434/v1"),
+    "deepseek": ("deepseek", "https://api.deepseek.com/v1"),
+}
 
 
 def create_provider(
@@ -27,7 +90,7 @@ def create_provider(
     3. Fall back to OpenAI-compatible protocol
     """
     # Check model_list first
-    model_cfg = _find_model_config(model_name, config.model_list)
+    model_cfg = config.model_index.get(model_name)
 
     if model_cfg:
         model_id = model_cfg.model or model_name
@@ -38,10 +101,15 @@ def create_provider(
         api_key = ""
         api_base = ""
 
-    # Determine protocol from model identifier
-    if any(model_id.startswith(p) for p in ANTHROPIC_PREFIXES):
+    # Determine protocol from model identifier — one dict lookup on the
+    # token before "/", with bare "claude*" names as the only special case
+    protocol = _PROTOCOL_BY_PREFIX.get(model_id.partition("/")[0])
+    if protocol is None and model_id.startswith("claude"):
+        protocol = "anthropic"
+
+    if protocol == "anthropic":
         return _create_anthropic(model_id, api_key, api_base, config.providers)
-    elif any(model_id.startswith(p) for p in COPILOT_PREFIXES):
+    elif protocol == "copilot":
         raise NotImplementedError("GitHub Copilot provider not yet implemented")
     else:
         # Check if we have OAuth credentials for OpenAI Codex
@@ -51,47 +119,30 @@ def create_provider(
         return _create_openai(model_id, api_key, api_base, config.providers)
 
 
-def _find_model_config(name: str, model_list: list[ModelConfig]) -> ModelConfig | None:
-    for mc in model_list:
-        if mc.model_name == name:
-            return mc
-    return None
-
-
 def _create_openai(
     model_id: str,
     api_key: str,
     api_base: str,
     providers: ProvidersConfig,
 ) -> LLMProvider:
-    from pyclaw.providers.openai_provider import OpenAIProvider
-
     # Strip provider prefix if present (e.g., "openai/gpt-4o" → "gpt-4o")
-    actual_model = model_id
-    for prefix in ("openai/", "openrouter/", "groq/", "ollama/", "deepseek/", "gemini/", "qwen/"):
-        if model_id.startswith(prefix):
-            actual_model = model_id[len(prefix):]
-            break
+    prefix, sep, rest = model_id.partition("/")
+    actual_model = rest if sep and prefix in _OPENAI_STRIP_PREFIXES else model_id
 
     # Resolve API key from provider config if not set
     if not api_key:
-        if model_id.startswith("openrouter/"):
-            api_key = providers.openrouter.api_key
-            api_base = api_base or providers.openrouter.api_base or "https://openrouter.ai/api/v1"
-        elif model_id.startswith("groq/"):
-            api_key = providers.groq.api_key
-            api_base = api_base or providers.groq.api_base or "https://api.groq.com/openai/v1"
-        elif model_id.startswith("ollama/"):
-            api_base = api_base or providers.ollama.api_base or "http://localhost:11434/v1"
-            api_key = api_key or "ollama"
-        elif model_id.startswith("deepseek/"):
-            api_key = providers.deepseek.api_key
-            api_base = api_base or providers.deepseek.api_base or "https://api.deepseek.com/v1"
+        entry = _OPENAI_PREFIX_TABLE.get(prefix) if sep else None
+        if entry is not None:
+            attr, default_base = entry
+            pcfg = getattr(providers, attr)
+            api_base = api_base or pcfg.api_base or default_base
+            # Ollama ignores keys; anything non-empty satisfies the client
+            api_key = "ollama" if attr == "ollama" else pcfg.api_key
         else:
             api_key = providers.openai.api_key
             api_base = api_base or providers.openai.api_base or ""
 
-    return OpenAIProvider(model=actual_model, api_key=api_key, api_base=api_base)
+    return _openai_provider_cls()(model=actual_model, api_key=api_key, api_base=api_base)
 
 
 def _create_anthropic(
@@ -100,8 +151,6 @@ def _create_anthropic(
     api_base: str,
     providers: ProvidersConfig,
 ) -> LLMProvider:
-    from pyclaw.providers.anthropic_provider import AnthropicProvider
-
     actual_model = model_id
     if model_id.startswith("anthropic/"):
         actual_model = model_id[len("anthropic/"):]
@@ -110,23 +159,25 @@ def _create_anthropic(
         api_key = providers.anthropic.api_key
         api_base = api_base or providers.anthropic.api_base or ""
 
-    return AnthropicProvider(model=actual_model, api_key=api_key, api_base=api_base)
+    return _anthropic_provider_cls()(model=actual_model, api_key=api_key, api_base=api_base)
 
 
 def _try_create_codex(model_id: str, config: Config) -> LLMProvider | None:
     """Try to create a Codex provider using stored OAuth credentials."""
     try:
-        from pyclaw.auth.credentials import CredentialStore
-        store = CredentialStore(config.config_dir)
+        store = _credential_store(str(config.config_dir))
         cred = store.get("openai-codex")
         if cred is None or cred.auth_type != "oauth":
             return None
 
-        from pyclaw.providers.codex_provider import CodexProvider
-        return CodexProvider(
+        cache_dir = None
+        if config.providers.openai.cache_responses:
+            cache_dir = config.config_dir / "cache" / "responses"
+        return _codex_provider_cls()(
             access_token=cred.access_token,
             account_id=cred.account_id,
             default_model=model_id,
+            cache_dir=cache_dir,
         )
     except Exception:
         return None
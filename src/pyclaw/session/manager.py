@@ -20,6 +20,7 @@ class SessionManager:
         self._storage = Path(storage_dir).expanduser().resolve()
         self._storage.mkdir(parents=True, exist_ok=True)
         self._sessions: dict[str, Session] = {}
+        self._dirty: set[str] = set()
         self._load_sessions()
 
     def get_or_create(self, key: str) -> Session:
@@ -31,11 +32,13 @@ class SessionManager:
         session = self.get_or_create(session_key)
         session.messages.append(Message(role=role, content=content))
         session.updated = datetime.now()
+        self._dirty.add(session_key)
 
     def add_full_message(self, session_key: str, msg: Message) -> None:
         session = self.get_or_create(session_key)
         session.messages.append(msg)
         session.updated = datetime.now()
+        self._dirty.add(session_key)
 
     def get_history(self, key: str) -> list[Message]:
         session = self._sessions.get(key)
@@ -49,17 +52,20 @@ class SessionManager:
         session = self.get_or_create(key)
         session.summary = summary
         session.updated = datetime.now()
+        self._dirty.add(key)
 
     def truncate_history(self, key: str, keep_last: int) -> None:
         session = self._sessions.get(key)
         if session and len(session.messages) > keep_last:
             session.messages = session.messages[-keep_last:]
             session.updated = datetime.now()
+            self._dirty.add(key)
 
     def set_history(self, key: str, history: list[Message]) -> None:
         session = self.get_or_create(key)
         session.messages = history
         session.updated = datetime.now()
+        self._dirty.add(key)
 
     def clear(self, key: str) -> None:
         session = self._sessions.get(key)
@@ -67,11 +73,18 @@ class SessionManager:
             session.messages = []
             session.summary = ""
             session.updated = datetime.now()
+            self._dirty.add(key)
+
+    def save_if_dirty(self, key: str) -> None:
+        """Persist the session only if it changed since the last save."""
+        if key in self._dirty:
+            self.save(key)
 
     def save(self, key: str) -> None:
         session = self._sessions.get(key)
         if session is None:
             return
+        self._dirty.discard(key)
         path = self._session_path(key)
         path.parent.mkdir(parents=True, exist_ok=True)
         data = session.model_dump(mode="json")
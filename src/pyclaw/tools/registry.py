@@ -16,9 +16,11 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
+        self._defs_cache: list[ToolDefinition] | None = None
 
     def register(self, tool: Tool) -> None:
         self._tools[tool.name()] = tool
+        self._defs_cache = None
 
     def get(self, name: str) -> Tool | None:
         return self._tools.get(name)
@@ -51,10 +53,13 @@ class ToolRegistry:
             return ToolResult.error(f"Tool execution error: {e}")
 
     def get_definitions(self) -> list[ToolDefinition]:
-        """Get tool definitions for LLM consumption."""
-        defs = []
-        for tool in self._tools.values():
-            defs.append(
+        """Get tool definitions for LLM consumption.
+
+        The list is memoized and invalidated on `register`, since it is
+        requested on every iteration of the agent loop.
+        """
+        if self._defs_cache is None:
+            self._defs_cache = [
                 ToolDefinition(
                     function=ToolFunctionDefinition(
                         name=tool.name(),
@@ -62,8 +67,9 @@ class ToolRegistry:
                         parameters=tool.parameters(),
                     )
                 )
-            )
-        return defs
+                for tool in self._tools.values()
+            ]
+        return self._defs_cache
 
     def list_names(self) -> list[str]:
         return list(self._tools.keys())
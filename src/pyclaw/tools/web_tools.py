@@ -22,6 +22,9 @@ class WebFetchTool(Tool):
     def description(self) -> str:
         return "Fetch the content of a web page by URL. Returns the page text."
 
+    def cacheable(self) -> bool:
+        return True
+
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
@@ -60,6 +63,9 @@ class WebSearchTool(Tool):
     def description(self) -> str:
         return "Search the web for information. Returns search results with titles, URLs, and snippets."
 
+    def cacheable(self) -> bool:
+        return True
+
     def parameters(self) -> dict[str, Any]:
         return {
             "type": "object",
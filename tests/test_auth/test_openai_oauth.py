@@ -10,12 +10,15 @@ import base64
 import json
 
 
+# The header and signature segments never vary — encode them once.
+_JWT_HEADER = base64.urlsafe_b64encode(json.dumps({"alg": "RS256"}).encode()).rstrip(b"=").decode()
+_JWT_SIG = base64.urlsafe_b64encode(b"fake_sig").rstrip(b"=").decode()
+
+
 def _make_jwt(payload: dict) -> str:
     """Create a fake JWT for testing."""
-    header = base64.urlsafe_b64encode(json.dumps({"alg": "RS256"}).encode()).rstrip(b"=").decode()
     body = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
-    sig = base64.urlsafe_b64encode(b"fake_sig").rstrip(b"=").decode()
-    return f"{header}.{body}.{sig}"
+    return f"{_JWT_HEADER}.{body}.{_JWT_SIG}"
 
 
 def test_decode_jwt_payload():
@@ -39,3 +39,25 @@ async def test_close():
     bus.close()
     received = await bus.consume_inbound()
     assert received is None
+
+
+@pytest.mark.asyncio
+async def test_publish_outbound_many():
+    bus = MessageBus()
+    msgs = [
+        OutboundMessage(channel="test", content="part1"),
+        OutboundMessage(channel="test", content="part2"),
+    ]
+    await bus.publish_outbound_many(msgs)
+    first = await bus.consume_outbound()
+    second = await bus.consume_outbound()
+    assert first is not None and first.content == "part1"
+    assert second is not None and second.content == "part2"
+
+
+@pytest.mark.asyncio
+async def test_publish_outbound_many_closed():
+    bus = MessageBus()
+    bus.close()
+    await bus.publish_outbound_many([OutboundMessage(channel="test", content="x")])
+    assert await bus.consume_outbound() is None